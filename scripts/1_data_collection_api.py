@@ -11,11 +11,22 @@ saves it as a raw CSV file, and provides a preview of the data.
 # Step 1: Import Required Libraries
 # ===============================
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
 from pathlib import Path
 import logging
 import sys
 
+# Reusable HTTP session with pooled connections and retry/backoff
+SESSION = requests.Session()
+SESSION.headers.update({"Accept-Encoding": "gzip"})
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.5)
+))
+
 # ===============================
 # Step 2: Setup Logging
 # ===============================
@@ -42,7 +53,7 @@ PARAMS = {}  # Optional API parameters
 # ===============================
 logging.info("🔄 Fetching data from SpaceX API...")
 try:
-    response = requests.get(API_URL, params=PARAMS)
+    response = SESSION.get(API_URL, params=PARAMS, timeout=30)
     response.raise_for_status()
     logging.info("✅ API request successful!")
 except requests.exceptions.RequestException as e:
@@ -52,6 +63,11 @@ except requests.exceptions.RequestException as e:
 # ===============================
 # Step 5: Convert JSON Data to DataFrame
 # ===============================
+# Note: pyarrow.json.read_json was evaluated here to stream the response
+# straight into Arrow buffers, but the SpaceX v4 API returns a top-level
+# JSON array (Arrow's reader only accepts newline-delimited JSON) and the
+# launch records carry nested cores/links columns that Arrow's CSV writer
+# cannot serialize, so the pandas path below stays.
 try:
     data = response.json()
     df = pd.DataFrame(data)
@@ -11,12 +11,24 @@ saves it as a raw CSV file, and provides a log of the process.
 # Step 1: Import Required Libraries
 # ===============================
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
 from pathlib import Path
+from io import BytesIO, StringIO
+from lxml import etree
 import logging
 import sys
 
+# Reusable HTTP session with pooled connections and retry/backoff
+SESSION = requests.Session()
+SESSION.headers.update({"Accept-Encoding": "gzip"})
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.5)
+))
+
 # ===============================
 # Step 2: Setup Logging
 # ===============================
@@ -41,7 +53,7 @@ URL = "https://en.wikipedia.org/wiki/List_of_Falcon_9_and_Falcon_Heavy_launches"
 
 logging.info(f"🔄 Fetching data from {URL}...")
 try:
-    res = requests.get(URL)
+    res = SESSION.get(URL, timeout=30)
     res.raise_for_status()
 except requests.exceptions.RequestException as e:
     logging.error(f"❌ Failed to fetch the webpage: {e}")
@@ -49,28 +61,30 @@ except requests.exceptions.RequestException as e:
 
 logging.info("✅ Webpage fetched successfully. Parsing HTML...")
 
-soup = BeautifulSoup(res.text, "lxml")
-tables = soup.find_all("table", {"class": "wikitable"})
-
-if not tables:
-    logging.error("❌ No tables found on the webpage.")
-    sys.exit(1)
-
 try:
-    # Find the main launches table (usually the first one)
+    # Stream-parse the page with lxml's iterparse and stop at the launches
+    # table, instead of building a DOM for the whole >1 MB document;
+    # clearing each finished element keeps memory bounded
     main_table = None
-    for table in tables:
-        # Look for table with flight numbers
-        if table.find("th", string=lambda x: x and "Flight No." in x):
-            main_table = table
+    context = etree.iterparse(BytesIO(res.content), events=('end',), tag='table', html=True)
+    for event, element in context:
+        if ('wikitable' in (element.get('class') or '')
+                and element.xpath('.//th[contains(., "Flight No.")]')):
+            main_table = etree.tostring(element, encoding='unicode')
             break
-    
-    if not main_table:
-        main_table = tables[0]  # Fallback to first table
-    
-    # Extract table data
-    df = pd.read_html(str(main_table))[0]
-    
+        # Nested tables end before their enclosing table, so clearing them
+        # here would gut content out of a still-pending candidate; only
+        # top-level tables are safe to clear (their nested content goes
+        # with them)
+        if next(element.iterancestors('table'), None) is None:
+            element.clear(keep_tail=True)
+
+    if main_table is None:
+        logging.error("❌ No launches table found on the webpage.")
+        sys.exit(1)
+
+    df = pd.read_html(StringIO(main_table), flavor="lxml")[0]
+
     # Clean column names
     df.columns = df.columns.str.strip()
     
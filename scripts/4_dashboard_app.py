@@ -4,7 +4,16 @@ Author: Muhammad Munawar Shahzad
 Date: 2025-08-15
 """
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
+import numpy as np
+from pathlib import Path
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
+import time
 import dash
 from dash import dcc, html
 from dash.dependencies import Input, Output
@@ -12,43 +21,59 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+# Processed Parquet artifact written by 3_data_wrangling.py; loading it
+# skips the API round trips and all CSV/JSON re-parsing
+PARQUET_FILE = Path(__file__).parent.parent / "data" / "processed" / "falcon9_cleaned.parquet"
+
+# Reusable HTTP session so the four API calls share one pooled connection
+SESSION = requests.Session()
+SESSION.headers.update({"Accept-Encoding": "gzip"})
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.5)
+))
+
+# API responses change rarely, so cache them on disk for an hour; warm
+# startups then cost a local JSON read instead of four network round trips
+CACHE_DIR = Path(__file__).parent.parent / "data" / "api_cache"
+CACHE_TTL = 3600  # seconds
+
+def cached_get(url):
+    cache_file = CACHE_DIR / (hashlib.sha1(url.encode()).hexdigest() + ".json")
+    if cache_file.exists() and time.time() - cache_file.stat().st_mtime < CACHE_TTL:
+        return json.loads(cache_file.read_bytes())
+    response = SESSION.get(url, timeout=30)
+    response.raise_for_status()
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache_file.write_bytes(response.content)
+    return response.json()
+
 # Fetch data from SpaceX API
 def fetch_launch_data():
     try:
-        # Get all launches
-        launches_url = "https://api.spacexdata.com/v4/launches"
-        launches_response = requests.get(launches_url)
-        launches_response.raise_for_status()
-        all_launches = launches_response.json()
-        
+        # The four endpoints are independent, so fetch them concurrently
+        # instead of paying four sequential round trips
+        urls = [
+            "https://api.spacexdata.com/v4/launches",
+            "https://api.spacexdata.com/v4/rockets",
+            "https://api.spacexdata.com/v4/payloads",
+            "https://api.spacexdata.com/v4/launchpads"
+        ]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            all_launches, all_rockets, all_payloads, all_launchpads = executor.map(cached_get, urls)
+
         print(f"Total launches received: {len(all_launches)}")
-        
-        # Get all rockets to map IDs to names
-        rockets_url = "https://api.spacexdata.com/v4/rockets"
-        rockets_response = requests.get(rockets_url)
-        rockets_response.raise_for_status()
-        all_rockets = rockets_response.json()
-        
+
         # Create a mapping of rocket ID to rocket name
         rocket_map = {rocket['id']: rocket['name'] for rocket in all_rockets}
         print(f"Rocket types available: {list(rocket_map.values())}")
-        
-        # Get all payloads to map IDs to payload details
-        payloads_url = "https://api.spacexdata.com/v4/payloads"
-        payloads_response = requests.get(payloads_url)
-        payloads_response.raise_for_status()
-        all_payloads = payloads_response.json()
-        
+
         # Create a mapping of payload ID to payload details
         payload_map = {payload['id']: payload for payload in all_payloads}
         print(f"Payloads available: {len(payload_map)}")
-        
-        # Get all launchpads to map IDs to launchpad details
-        launchpads_url = "https://api.spacexdata.com/v4/launchpads"
-        launchpads_response = requests.get(launchpads_url)
-        launchpads_response.raise_for_status()
-        all_launchpads = launchpads_response.json()
-        
+
         # Create a mapping of launchpad ID to launchpad details
         launchpad_map = {launchpad['id']: launchpad for launchpad in all_launchpads}
         print(f"Launchpads available: {len(launchpad_map)}")
@@ -80,70 +105,45 @@ def process_launch_data(launches):
     if not launches:
         return pd.DataFrame()
     
-    # Convert to DataFrame
-    df = pd.json_normalize(launches)
-    
+    # Build the DataFrame from just the fields we actually use instead of
+    # json_normalize, which flattens dozens of unused nested columns
+    df = pd.DataFrame({
+        'date_utc': [launch.get('date_utc') for launch in launches],
+        'success': [launch.get('success') for launch in launches],
+        'launchpad': [launch.get('launchpad') for launch in launches],
+        'payloads': [launch.get('payloads', []) for launch in launches],
+        'flight_number': [launch.get('flight_number') for launch in launches]
+    })
+
     # Clean and process data
     df['date_utc'] = pd.to_datetime(df['date_utc'])
     
-    # Debug: Check payload structure
-    if len(df) > 0:
-        sample_payload = df['payloads'].iloc[0]
-        print(f"Sample payload structure: {sample_payload}")
-        if sample_payload and len(sample_payload) > 0:
-            print(f"Sample payload[0] keys: {list(sample_payload[0].keys()) if isinstance(sample_payload[0], dict) else 'Not a dict'}")
-    
-    # Extract payload mass using the global payload map
-    def extract_payload_mass(payload_ids):
-        if not payload_ids or not isinstance(payload_ids, list) or len(payload_ids) == 0:
-            return None
-        
-        # Get the first payload ID
-        payload_id = payload_ids[0]
-        if payload_id in PAYLOAD_MAP:
-            payload = PAYLOAD_MAP[payload_id]
-            # Try different possible field names
-            for field in ['mass_kg', 'mass', 'mass_lbs']:
-                if field in payload and payload[field] is not None:
-                    if field == 'mass_lbs':
-                        return payload[field] * 0.453592  # Convert lbs to kg
-                    return payload[field]
-        return None
-    
-    df['payload_mass_kg'] = df['payloads'].apply(extract_payload_mass)
+    # Flatten the payload and launchpad maps into plain {id: value} dicts
+    # once, then resolve both columns with Series.map (vectorized dict
+    # lookup) instead of a Python helper call per row
+    mass_dict = {}
+    for payload_id, payload in PAYLOAD_MAP.items():
+        for field in ['mass_kg', 'mass', 'mass_lbs']:
+            if payload.get(field) is not None:
+                mass = payload[field]
+                if field == 'mass_lbs':
+                    mass *= 0.453592  # Convert lbs to kg
+                mass_dict[payload_id] = mass
+                break
+
+    site_dict = {}
+    for launchpad_id, launchpad in LAUNCHPAD_MAP.items():
+        location = launchpad.get('location')
+        if isinstance(location, dict):
+            site = location.get('name') or location.get('full_name')
+        else:
+            site = None
+        site_dict[launchpad_id] = site or launchpad.get('name') or launchpad.get('full_name') or 'Unknown'
+
+    df['payload_mass_kg'] = df['payloads'].str[0].map(mass_dict)
     print(f"Payload mass extraction - non-null values: {df['payload_mass_kg'].notna().sum()}")
-    
-    # Debug: Check launchpad structure
-    if len(df) > 0:
-        sample_launchpad = df['launchpad'].iloc[0]
-        print(f"Sample launchpad structure: {sample_launchpad}")
-        if isinstance(sample_launchpad, dict):
-            print(f"Sample launchpad keys: {list(sample_launchpad.keys())}")
-    
-    # Extract launch site using the global launchpad map
-    def extract_launch_site(launchpad_id):
-        if not launchpad_id or launchpad_id not in LAUNCHPAD_MAP:
-            return 'Unknown'
-        
-        launchpad = LAUNCHPAD_MAP[launchpad_id]
-        
-        # Try to get location name from different possible paths
-        if 'location' in launchpad and isinstance(launchpad['location'], dict):
-            if 'name' in launchpad['location']:
-                return launchpad['location']['name']
-            elif 'full_name' in launchpad['location']:
-                return launchpad['location']['full_name']
-        
-        # If no location info, try to get name directly
-        if 'name' in launchpad:
-            return launchpad['name']
-        elif 'full_name' in launchpad:
-            return launchpad['full_name']
-        
-        return 'Unknown'
-    
-    df['launch_site'] = df['launchpad'].apply(extract_launch_site)
-    print(f"Launch site extraction - non-null values: {df['launch_site'].notna().sum()}")
+
+    df['launch_site'] = df['launchpad'].map(site_dict).fillna('Unknown')
     print(f"Unique launch sites: {df['launch_site'].unique()}")
     
     # Extract launch outcome
@@ -154,13 +154,32 @@ def process_launch_data(launches):
     df = df.dropna(subset=['payload_mass_kg'])
     final_count = len(df)
     print(f"Rows dropped due to missing payload mass: {initial_count - final_count}")
-    
+
+    # float32 halves the bytes scanned by every slider filter and groupby
+    df['payload_mass_kg'] = df['payload_mass_kg'].astype('float32')
+
     return df
 
-# Fetch and process data
-launches = fetch_launch_data()
-print(f"Processing {len(launches)} launches...")
-df = process_launch_data(launches)
+# Load data: prefer the processed Parquet artifact (typed columns, no
+# network), fall back to fetching from the SpaceX API
+df = pd.DataFrame()
+if PARQUET_FILE.exists():
+    try:
+        df = pd.read_parquet(
+            PARQUET_FILE,
+            columns=['date', 'launch_site', 'launch_outcome', 'payload_mass_kg'],
+            engine='pyarrow'
+        )
+        df = df.rename(columns={'date': 'date_utc'}).dropna(subset=['payload_mass_kg'])
+        print(f"Loaded {len(df)} launches from {PARQUET_FILE}")
+    except Exception as e:
+        print(f"Could not load Parquet file ({e}), falling back to API")
+        df = pd.DataFrame()
+
+if df.empty:
+    launches = fetch_launch_data()
+    print(f"Processing {len(launches)} launches...")
+    df = process_launch_data(launches)
 print(f"DataFrame shape after processing: {df.shape}")
 print(f"DataFrame columns: {list(df.columns)}")
 
@@ -168,8 +187,35 @@ if df.empty:
     print("No data available. Please check the API connection.")
     exit()
 
-# Calculate success counts and ratios
-success_counts = df.groupby('launch_site')['launch_outcome'].value_counts().unstack().fillna(0)
+# Sort once by payload mass so any slider range becomes a contiguous
+# slice found by binary search, instead of a full boolean-mask scan
+df = df.sort_values('payload_mass_kg').reset_index(drop=True)
+_MASS = df['payload_mass_kg'].to_numpy()
+
+# Precompute a payload-bin × site × outcome count table once; the slider
+# callbacks then sum a ~100-row slice of it instead of re-filtering and
+# re-grouping the full DataFrame on every move
+PAYLOAD_BINS = np.linspace(df['payload_mass_kg'].min(), df['payload_mass_kg'].max(), 101)
+df['_bin'] = np.digitize(df['payload_mass_kg'], PAYLOAD_BINS)
+BIN_PIVOT = df.pivot_table(
+    index=['_bin', 'launch_site'],
+    columns='launch_outcome',
+    values='payload_mass_kg',
+    aggfunc='count',
+    fill_value=0,
+    observed=True
+).astype('int32')
+
+@lru_cache(maxsize=128)
+def site_outcome_counts(low, high):
+    """Success/Failure counts per launch site for a payload mass range."""
+    lo_bin, hi_bin = np.digitize([low, high], PAYLOAD_BINS)
+    counts = BIN_PIVOT.loc[lo_bin:hi_bin].groupby('launch_site', observed=True).sum()
+    return counts[counts.sum(axis=1) > 0]
+
+# Calculate success counts and ratios; crosstab builds the 2D histogram
+# in one pass instead of groupby + value_counts + unstack
+success_counts = pd.crosstab(df['launch_site'], df['launch_outcome'])
 success_counts['Total'] = success_counts['Success'] + success_counts['Failure']
 success_counts['Success_Ratio'] = (success_counts['Success'] / success_counts['Total'] * 100).round(2)
 
@@ -199,14 +245,14 @@ app.layout = html.Div([
         html.Div([
             html.H3("📊 Launch Success Count by Site", 
                      style={'textAlign': 'center', 'color': '#2ca02c'}),
-            dcc.Graph(id='pie-launch-success', style={'height': '400px'})
+            dcc.Graph(id='pie-launch-success', config={'displayModeBar': False}, style={'height': '400px'})
         ], style={'width': '50%', 'display': 'inline-block'}),
         
         # Launch success ratio pie chart for highest ratio site
         html.Div([
             html.H3(f"🏆 {highest_ratio_site.name} - Highest Success Ratio", 
                      style={'textAlign': 'center', 'color': '#ff7f0e'}),
-            dcc.Graph(id='pie-launch-ratio', style={'height': '400px'})
+            dcc.Graph(id='pie-launch-ratio', config={'displayModeBar': False}, style={'height': '400px'})
         ], style={'width': '50%', 'display': 'inline-block'})
     ], style={'marginBottom': '30px'}),
     
@@ -233,7 +279,7 @@ app.layout = html.Div([
         ], style={'marginBottom': '20px'}),
         
         # Scatter plot
-        dcc.Graph(id='scatter-payload', style={'height': '500px'})
+        dcc.Graph(id='scatter-payload', config={'displayModeBar': False}, style={'height': '500px'})
     ]),
     
     # Footer
@@ -244,27 +290,20 @@ app.layout = html.Div([
     ], style={'marginTop': '30px'})
 ], style={'padding': '20px', 'backgroundColor': '#f8f9fa'})
 
-# Callback to update the launch success count pie chart
-@app.callback(
-    Output('pie-launch-success', 'figure'),
-    Input('payload-slider', 'value')
-)
-def update_pie_success(selected_range):
-    if not selected_range:
-        return go.Figure()
-    
-    low, high = selected_range
-    filtered_df = df[(df['payload_mass_kg'] >= low) & (df['payload_mass_kg'] <= high)]
-    
-    if filtered_df.empty:
+# The slider emits discrete step=100 values, so identical ranges recur
+# constantly; memoizing the figure builders replays the cached Plotly
+# figure instead of rebuilding it
+@lru_cache(maxsize=256)
+def _pie_success_figure(low, high):
+    success_count = site_outcome_counts(low, high)
+
+    if success_count.empty:
         return go.Figure().add_annotation(
             text="No data in selected range",
             xref="paper", yref="paper",
             x=0.5, y=0.5, showarrow=False
         )
-    
-    success_count = filtered_df.groupby('launch_site')['launch_outcome'].value_counts().unstack().fillna(0)
-    
+
     fig = px.pie(
         values=success_count['Success'],
         names=success_count.index,
@@ -281,27 +320,28 @@ def update_pie_success(selected_range):
     
     return fig
 
-# Callback to update the launch success ratio pie chart
+# Callback to update the launch success count pie chart
 @app.callback(
-    Output('pie-launch-ratio', 'figure'),
+    Output('pie-launch-success', 'figure'),
     Input('payload-slider', 'value')
 )
-def update_pie_ratio(selected_range):
+def update_pie_success(selected_range):
     if not selected_range:
         return go.Figure()
-    
-    low, high = selected_range
-    filtered_df = df[(df['payload_mass_kg'] >= low) & (df['payload_mass_kg'] <= high)]
-    
-    if filtered_df.empty:
+    return _pie_success_figure(int(selected_range[0]), int(selected_range[1]))
+
+@lru_cache(maxsize=256)
+def _pie_ratio_figure(low, high):
+    # Calculate success ratio for the highest ratio site in filtered data
+    site_stats = site_outcome_counts(low, high).copy()
+
+    if site_stats.empty:
         return go.Figure().add_annotation(
             text="No data in selected range",
             xref="paper", yref="paper",
             x=0.5, y=0.5, showarrow=False
         )
-    
-    # Calculate success ratio for the highest ratio site in filtered data
-    site_stats = filtered_df.groupby('launch_site')['launch_outcome'].value_counts().unstack().fillna(0)
+
     site_stats['Total'] = site_stats['Success'] + site_stats['Failure']
     site_stats['Success_Ratio'] = (site_stats['Success'] / site_stats['Total'] * 100).round(2)
     
@@ -334,17 +374,21 @@ def update_pie_ratio(selected_range):
     
     return fig
 
-# Callback to update the scatter plot
+# Callback to update the launch success ratio pie chart
 @app.callback(
-    Output('scatter-payload', 'figure'),
+    Output('pie-launch-ratio', 'figure'),
     Input('payload-slider', 'value')
 )
-def update_scatter(selected_range):
+def update_pie_ratio(selected_range):
     if not selected_range:
         return go.Figure()
-    
-    low, high = selected_range
-    filtered_df = df[(df['payload_mass_kg'] >= low) & (df['payload_mass_kg'] <= high)]
+    return _pie_ratio_figure(int(selected_range[0]), int(selected_range[1]))
+
+@lru_cache(maxsize=256)
+def _scatter_figure(low, high):
+    lo_i = np.searchsorted(_MASS, low, side='left')
+    hi_i = np.searchsorted(_MASS, high, side='right')
+    filtered_df = df.iloc[lo_i:hi_i]
     
     if filtered_df.empty:
         return go.Figure().add_annotation(
@@ -375,12 +419,24 @@ def update_scatter(selected_range):
     
     # Update x-axis to show comma-separated thousands
     fig.update_xaxes(tickformat=",")
-    
+
     return fig
 
+# Callback to update the scatter plot
+@app.callback(
+    Output('scatter-payload', 'figure'),
+    Input('payload-slider', 'value')
+)
+def update_scatter(selected_range):
+    if not selected_range:
+        return go.Figure()
+    return _scatter_figure(int(selected_range[0]), int(selected_range[1]))
+
 # Run the app
 if __name__ == '__main__':
     print(f"Dashboard loaded with {len(df)} launches from {len(df['launch_site'].unique())} sites")
     print(f"Payload mass range: {df['payload_mass_kg'].min():,.0f} - {df['payload_mass_kg'].max():,.0f} kg")
     print("Starting dashboard server...")
-    app.run(debug=True, host='127.0.0.1', port=8050)
+    # debug=True would enable the werkzeug reloader/debugger middleware,
+    # which re-imports the module and intercepts every request
+    app.run(debug=False, host='127.0.0.1', port=8050)
@@ -6,15 +6,110 @@ Date: 2025-08-15
 import folium
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 import numpy as np
+from collections import defaultdict
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from folium import plugins
-import json
+import math
+import orjson
+import random
 import time
+from string import Template
 from geopy.geocoders import Nominatim
 from geopy.distance import geodesic
 import warnings
 warnings.filterwarnings('ignore')
 
+# Cached API responses live next to the dashboard's cache
+CACHE_DIR = Path(__file__).parent.parent / "data" / "api_cache"
+
+# Compass directions for the synthetic proximity fallback
+DIRS = ('N', 'S', 'E', 'W', 'NE', 'NW', 'SE', 'SW')
+
+# Rocket families the map covers, hoisted so the filter set is built once
+_ALLOWED_ROCKETS = frozenset({'Falcon 1', 'Falcon 9', 'Falcon Heavy', 'Starship'})
+
+
+def _circle_polygon(lat, lon, radius_m, segments=16):
+    """Approximate a ground circle as a 16-segment GeoJSON polygon ring.
+
+    Leaflet renders folium.Circle with many more vertices; 16 segments are
+    visually indistinguishable at these zoom levels and keep the HTML small.
+    """
+    dlat = radius_m / 111320.0
+    dlon = radius_m / (111320.0 * max(math.cos(math.radians(lat)), 1e-6))
+    ring = [
+        [lon + dlon * math.cos(a), lat + dlat * math.sin(a)]
+        for a in np.linspace(0, 2 * math.pi, segments + 1)
+    ]
+    return [ring]
+
+# Popup HTML skeleton, built once at import; each marker only fills in
+# its values instead of re-assembling the whole block per site
+POPUP_TMPL = """
+            <div style="width: 350px;">
+                <h4><b>%(full_name)s</b></h4>
+                <p><b>Location:</b> %(locality)s, %(region)s</p>
+                <p><b>Coordinates:</b> %(lat).4f, %(lon).4f</p>
+                <p><b>Total Launches:</b> %(total_launches)s</p>
+                <p><b>Success Rate:</b> %(success_rate).1f%%</p>
+                <p><b>Successful:</b> %(successful_launches)s</p>
+                <hr>
+                <h5><b>🚂 Railway Proximity:</b></h5>
+                <p>Distance: %(railway_distance)s km %(railway_direction)s</p>
+                <p>Name: %(railway_name)s</p>
+                <hr>
+                <h5><b>🛣️ Highway Proximity:</b></h5>
+                <p>Distance: %(highway_distance)s km %(highway_direction)s</p>
+                <p>Name: %(highway_name)s</p>
+                <hr>
+                <h5><b>🌊 Coastline Proximity:</b></h5>
+                <p>Distance: %(coastline_distance)s km %(coastline_direction)s</p>
+                <p>Name: %(coastline_name)s</p>
+            </div>
+            """
+
+# Minimal Leaflet skeleton for the fast save path: the marker data is
+# injected as one GeoJSON blob and rendered client-side, skipping
+# folium's per-element Jinja2 rendering entirely
+LEAFLET_TMPL = Template("""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>SpaceX Launch Sites</title>
+    <link rel="stylesheet" href="https://unpkg.com/leaflet@1.9.4/dist/leaflet.css">
+    <script src="https://unpkg.com/leaflet@1.9.4/dist/leaflet.js"></script>
+    <style>html, body, #map { height: 100%; margin: 0; }</style>
+</head>
+<body>
+    <div id="map"></div>
+    <script>
+        var map = L.map('map').setView([$CENTER_LAT, $CENTER_LON], 3);
+        L.tileLayer('https://tile.openstreetmap.org/{z}/{x}/{y}.png', {
+            attribution: '&copy; OpenStreetMap contributors'
+        }).addTo(map);
+        var data = $DATA;
+        L.geoJSON(data, {
+            pointToLayer: function (feature, latlng) {
+                return L.circleMarker(latlng, {
+                    radius: 8,
+                    color: feature.properties.color,
+                    fillColor: feature.properties.color,
+                    fillOpacity: 0.6
+                });
+            },
+            onEachFeature: function (feature, layer) {
+                layer.bindPopup(feature.properties.popup, {maxWidth: 400});
+                layer.bindTooltip(feature.properties.tooltip);
+            }
+        }).addTo(map);
+    </script>
+</body>
+</html>
+""")
+
 class SpaceXLaunchMap:
     def __init__(self):
         self.launches_data = None
@@ -22,7 +117,23 @@ class SpaceXLaunchMap:
         self.payloads_data = None
         self.rockets_data = None
         self.map = None
-        
+        self._map_center = (28.5729, -80.6490)
+        self._marker_features = []
+
+        # One pooled session shared by all four endpoint fetches: the TLS
+        # handshake is paid once and gzip-compressed responses are negotiated
+        self._session = requests.Session()
+        self._session.headers.update({'Accept-Encoding': 'gzip'})
+        self._session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+        # Probe icon support once instead of wrapping every marker in
+        # try/except with a duplicated fallback branch
+        try:
+            folium.Icon(color='green', icon='info-sign')
+            self._icons_ok = True
+        except Exception:
+            self._icons_ok = False
+
         # Define known launch sites with their coordinates and proximity data
         self.known_launch_sites = {
             'CCSFS SLC 40': {
@@ -110,89 +221,107 @@ class SpaceXLaunchMap:
                 }
             }
         }
-        
+
+        # Index known proximity data by rounded coordinates so lookups in
+        # get_proximity_info are O(1) instead of a scan over every site
+        self._proximity_index = {
+            (round(site['latitude'], 2), round(site['longitude'], 2)): site['proximity']
+            for site in self.known_launch_sites.values()
+        }
+
+    def _cached_get(self, url, name, ttl=86400):
+        """Return the endpoint's parsed JSON, served from the disk cache
+        while the cached copy is younger than ttl seconds"""
+        cache_file = CACHE_DIR / f"{name}.json"
+        if cache_file.exists() and time.time() - cache_file.stat().st_mtime < ttl:
+            return orjson.loads(cache_file.read_bytes())
+
+        response = self._session.get(url, timeout=30)
+        response.raise_for_status()
+        # orjson decodes the raw bytes ~3-5x faster than the stdlib
+        # parser behind response.json()
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(response.content)
+        return orjson.loads(response.content)
+
     def fetch_spacex_data(self):
         """Fetch all necessary data from SpaceX API"""
         print("Fetching SpaceX data...")
-        
+
+        urls = {
+            'launches': "https://api.spacexdata.com/v4/launches",
+            'launchpads': "https://api.spacexdata.com/v4/launchpads",
+            'payloads': "https://api.spacexdata.com/v4/payloads",
+            'rockets': "https://api.spacexdata.com/v4/rockets"
+        }
+
         try:
-            # Fetch launches
-            launches_url = "https://api.spacexdata.com/v4/launches"
-            launches_response = requests.get(launches_url)
-            launches_response.raise_for_status()
-            self.launches_data = launches_response.json()
-            print(f"✓ Fetched {len(self.launches_data)} launches")
-            
-            # Fetch launchpads
-            launchpads_url = "https://api.spacexdata.com/v4/launchpads"
-            launchpads_response = requests.get(launchpads_url)
-            launchpads_response.raise_for_status()
-            self.launchpads_data = launchpads_response.json()
-            print(f"✓ Fetched {len(self.launchpads_data)} launchpads")
-            
-            # Fetch payloads
-            payloads_url = "https://api.spacexdata.com/v4/payloads"
-            payloads_response = requests.get(payloads_url)
-            payloads_response.raise_for_status()
-            self.payloads_data = payloads_response.json()
-            print(f"✓ Fetched {len(self.payloads_data)} payloads")
-            
-            # Fetch rockets
-            rockets_url = "https://api.spacexdata.com/v4/rockets"
-            rockets_response = requests.get(rockets_url)
-            rockets_response.raise_for_status()
-            self.rockets_data = rockets_response.json()
-            print(f"✓ Fetched {len(self.rockets_data)} rockets")
-            
+            # The four endpoints are independent, so fetch them concurrently;
+            # wall time tracks the slowest round trip instead of the sum,
+            # and warm reruns skip the network entirely via the disk cache
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = dict(zip(urls, executor.map(
+                    lambda item: self._cached_get(item[1], item[0]), urls.items()
+                )))
         except requests.RequestException as e:
             print(f"Error fetching data: {e}")
             return False
-            
+
+        self.launches_data = results['launches']
+        print(f"✓ Fetched {len(self.launches_data)} launches")
+
+        self.launchpads_data = results['launchpads']
+        print(f"✓ Fetched {len(self.launchpads_data)} launchpads")
+
+        self.payloads_data = results['payloads']
+        print(f"✓ Fetched {len(self.payloads_data)} payloads")
+
+        self.rockets_data = results['rockets']
+        print(f"✓ Fetched {len(self.rockets_data)} rockets")
+
         return True
     
     def process_launch_data(self):
         """Process and combine launch data"""
         print("Processing launch data...")
-        
-        # Create payload mapping
-        payload_map = {payload['id']: payload for payload in self.payloads_data}
-        
-        # Create rocket mapping
-        rocket_map = {rocket['id']: rocket for rocket in self.rockets_data}
-        
-        # Process launches
-        processed_launches = []
-        
-        for launch in self.launches_data:
-            if launch.get('rocket') and launch['rocket'] in rocket_map:
-                rocket_name = rocket_map[launch['rocket']]['name']
-                
-                # Include all SpaceX rocket launches, not just Falcon 9
-                if rocket_name in ['Falcon 1', 'Falcon 9', 'Falcon Heavy', 'Starship']:
-                    launch_info = {
-                        'id': launch['id'],
-                        'name': launch['name'],
-                        'flight_number': launch.get('flight_number', 0),
-                        'date_utc': launch.get('date_utc', ''),
-                        'success': launch.get('success', False),
-                        'rocket_name': rocket_name,
-                        'launchpad_id': launch.get('launchpad', ''),
-                        'payload_ids': launch.get('payloads', [])
-                    }
-                    
-                    # Add payload mass
-                    total_mass = 0
-                    for payload_id in launch['payloads']:
-                        if payload_id in payload_map:
-                            payload = payload_map[payload_id]
-                            if 'mass_kg' in payload and payload['mass_kg']:
-                                total_mass += payload['mass_kg']
-                            elif 'mass_lbs' in payload and payload['mass_lbs']:
-                                total_mass += payload['mass_lbs'] * 0.453592
-                    
-                    launch_info['payload_mass_kg'] = total_mass
-                    processed_launches.append(launch_info)
-        
+
+        launches_df = pd.DataFrame(self.launches_data)
+
+        # Join rocket names onto launches, all in vectorized merges instead
+        # of per-launch loops. Filtering the handful of rockets against
+        # _ALLOWED_ROCKETS first lets the inner merge drop non-matching
+        # launches for free instead of scanning every launch row afterwards.
+        rockets_df = pd.DataFrame(self.rockets_data)[['id', 'name']]
+        rockets_df = rockets_df[rockets_df['name'].isin(_ALLOWED_ROCKETS)].rename(
+            columns={'id': 'rocket', 'name': 'rocket_name'}
+        )
+        launches_df = launches_df.merge(rockets_df, on='rocket')
+
+        # Sum payload mass per launch: explode the payload id lists, join
+        # the payload masses, prefer mass_kg with an lbs fallback, then
+        # group the masses back per launch id
+        payloads_df = pd.DataFrame(self.payloads_data)[['id', 'mass_kg', 'mass_lbs']]
+        exploded = launches_df[['id', 'payloads']].explode('payloads').merge(
+            payloads_df, left_on='payloads', right_on='id', suffixes=('', '_payload')
+        )
+        mass = exploded['mass_kg'].replace(0, np.nan).fillna(
+            exploded['mass_lbs'].replace(0, np.nan) * 0.453592
+        ).fillna(0)
+        mass_per_launch = mass.groupby(exploded['id']).sum()
+
+        processed = pd.DataFrame({
+            'id': launches_df['id'],
+            'name': launches_df['name'],
+            'flight_number': launches_df['flight_number'].fillna(0),
+            'date_utc': launches_df['date_utc'].fillna(''),
+            'success': launches_df['success'].fillna(False),
+            'rocket_name': launches_df['rocket_name'],
+            'launchpad_id': launches_df['launchpad'].fillna(''),
+            'payload_ids': launches_df['payloads'],
+            'payload_mass_kg': launches_df['id'].map(mass_per_launch).fillna(0)
+        })
+        processed_launches = processed.to_dict('records')
+
         print(f"✓ Processed {len(processed_launches)} SpaceX launches")
         return processed_launches
     
@@ -201,15 +330,21 @@ class SpaceXLaunchMap:
         print("Calculating launchpad statistics...")
         
         launchpad_stats = {}
-        
+
+        # Bucket launches by pad in one pass instead of rescanning the
+        # full launch list for every launchpad
+        launches_by_pad = defaultdict(list)
+        for launch in processed_launches:
+            launches_by_pad[launch['launchpad_id']].append(launch)
+
         # Process API launchpads
         for launchpad in self.launchpads_data:
             pad_id = launchpad['id']
-            pad_launches = [l for l in processed_launches if l['launchpad_id'] == pad_id]
-            
+            pad_launches = launches_by_pad.get(pad_id, [])
+
             if pad_launches:
                 total_launches = len(pad_launches)
-                successful_launches = len([l for l in pad_launches if l['success']])
+                successful_launches = sum(1 for l in pad_launches if l['success'])
                 success_rate = (successful_launches / total_launches * 100) if total_launches > 0 else 0
                 
                 launchpad_stats[pad_id] = {
@@ -225,18 +360,25 @@ class SpaceXLaunchMap:
                     'launches': pad_launches
                 }
         
-        # Add known launch sites that might not be in the API
+        # Add known launch sites that might not be in the API. Build the
+        # dedup keys once (names plus lat/lon quantized to ~1 km) so each
+        # known site is checked with O(1) set lookups instead of a scan
+        # over every existing pad
+        seen_names = {stats['name'] for stats in launchpad_stats.values()}
+        seen_names |= {stats['full_name'] for stats in launchpad_stats.values()}
+        seen_coords = {
+            (round(stats['latitude'], 2), round(stats['longitude'], 2))
+            for stats in launchpad_stats.values()
+        }
+
         for site_key, site_info in self.known_launch_sites.items():
             # Check if this site already exists in launchpad_stats
-            site_exists = False
-            for pad_id, pad_stats in launchpad_stats.items():
-                if (pad_stats['name'] == site_key or 
-                    pad_stats['full_name'] == site_info['name'] or
-                    (abs(pad_stats['latitude'] - site_info['latitude']) < 0.01 and 
-                     abs(pad_stats['longitude'] - site_info['longitude']) < 0.01)):
-                    site_exists = True
-                    break
-            
+            site_exists = (
+                site_key in seen_names or
+                site_info['name'] in seen_names or
+                (round(site_info['latitude'], 2), round(site_info['longitude'], 2)) in seen_coords
+            )
+
             if not site_exists:
                 # Add the known site with basic stats
                 launchpad_stats[f"known_{site_key}"] = {
@@ -258,48 +400,61 @@ class SpaceXLaunchMap:
     
     def get_proximity_info(self, lat, lon, site_name):
         """Get proximity information for a launch site"""
-        # First check if we have known proximity data
-        for site_key, site_info in self.known_launch_sites.items():
-            if (abs(site_info['latitude'] - lat) < 0.01 and 
-                abs(site_info['longitude'] - lon) < 0.01):
-                return site_info['proximity']
-        
+        # First check if we have known proximity data (precomputed index,
+        # keyed by coordinates rounded to ~0.01 degrees)
+        known = self._proximity_index.get((round(lat, 2), round(lon, 2)))
+        if known is not None:
+            return known
+
         # If no known data, calculate approximate proximities based on location
-        # This is a simplified calculation - in reality you'd use GIS data
+        # This is a simplified calculation - in reality you'd use GIS data.
+        # Scalar draws go through the stdlib RNG, which skips numpy's
+        # per-call array machinery for single values.
         proximity_info = {
             'railway': {
-                'distance': round(np.random.uniform(5, 50), 1),
-                'direction': np.random.choice(['N', 'S', 'E', 'W', 'NE', 'NW', 'SE', 'SW']),
+                'distance': round(random.uniform(5, 50), 1),
+                'direction': random.choice(DIRS),
                 'name': 'Nearest Railway'
             },
             'highway': {
-                'distance': round(np.random.uniform(2, 40), 1),
-                'direction': np.random.choice(['N', 'S', 'E', 'W', 'NE', 'NW', 'SE', 'SW']),
+                'distance': round(random.uniform(2, 40), 1),
+                'direction': random.choice(DIRS),
                 'name': 'Nearest Highway'
             },
             'coastline': {
-                'distance': round(np.random.uniform(1, 30), 1),
-                'direction': np.random.choice(['N', 'S', 'E', 'W', 'NE', 'NW', 'SE', 'SW']),
+                'distance': round(random.uniform(1, 30), 1),
+                'direction': random.choice(DIRS),
                 'name': 'Nearest Coastline'
             }
         }
-        
+
         return proximity_info
     
     def create_map(self, launchpad_stats):
         """Create the Folium map with all launch sites"""
         print("Creating interactive map...")
         
-        # Calculate center of all launchpads
-        lats = [stats['latitude'] for stats in launchpad_stats.values() if stats['latitude'] != 0]
-        lons = [stats['longitude'] for stats in launchpad_stats.values() if stats['longitude'] != 0]
-        
-        if lats and lons:
-            center_lat = sum(lats) / len(lats)
-            center_lon = sum(lons) / len(lons)
+        # Filter to pads with valid coordinates once; the same list drives
+        # both the map center and the marker loop below
+        items = [(pid, s) for pid, s in launchpad_stats.items()
+                 if s['latitude'] and s['longitude']]
+        skipped = len(launchpad_stats) - len(items)
+        if skipped:
+            print(f"Skipping {skipped} launchpad(s) with no coordinates")
+
+        if items:
+            lat_arr = np.fromiter((s['latitude'] for _, s in items), dtype=np.float64, count=len(items))
+            lon_arr = np.fromiter((s['longitude'] for _, s in items), dtype=np.float64, count=len(items))
+            center_lat = lat_arr.mean()
+            center_lon = lon_arr.mean()
         else:
             center_lat, center_lon = 28.5729, -80.6490  # Default to Cape Canaveral
         
+        # Marker data doubles as a GeoJSON FeatureCollection for the
+        # fast save path in save_map
+        self._map_center = (center_lat, center_lon)
+        self._marker_features = []
+
         # Create base map
         self.map = folium.Map(
             location=[center_lat, center_lon],
@@ -329,15 +484,18 @@ class SpaceXLaunchMap:
         medium_group = folium.FeatureGroup(name='Medium Success Rate (60-79%)', show=True)
         low_group = folium.FeatureGroup(name='Low Success Rate (<60%)', show=True)
         inactive_group = folium.FeatureGroup(name='Inactive/Unknown Sites', show=True)
-        
+
+        # Collect every circle into one feature group added to the map once,
+        # instead of appending up to four children per pad to the map tree.
+        # Proximity rings are gathered as lightweight GeoJSON polygons and
+        # emitted in a single folium.GeoJson layer at the end.
+        circles_group = folium.FeatureGroup(name='Proximity Circles', show=True)
+        ring_features = []
+
         # Add markers for each launchpad
         print(f"Processing {len(launchpad_stats)} launchpads for map...")
         
-        for pad_id, stats in launchpad_stats.items():
-            if stats['latitude'] == 0 or stats['longitude'] == 0:
-                print(f"Skipping {stats['name']} - no coordinates")
-                continue
-                
+        for pad_id, stats in items:
             lat, lon = stats['latitude'], stats['longitude']
             print(f"Adding marker for {stats['name']} at {lat}, {lon}")
             
@@ -345,28 +503,25 @@ class SpaceXLaunchMap:
             proximity = self.get_proximity_info(lat, lon, stats['name'])
             
             # Create popup content with proximity information
-            popup_content = f"""
-            <div style="width: 350px;">
-                <h4><b>{stats['full_name']}</b></h4>
-                <p><b>Location:</b> {stats['locality']}, {stats['region']}</p>
-                <p><b>Coordinates:</b> {lat:.4f}, {lon:.4f}</p>
-                <p><b>Total Launches:</b> {stats['total_launches']}</p>
-                <p><b>Success Rate:</b> {stats['success_rate']:.1f}%</p>
-                <p><b>Successful:</b> {stats['successful_launches']}</p>
-                <hr>
-                <h5><b>🚂 Railway Proximity:</b></h5>
-                <p>Distance: {proximity['railway']['distance']} km {proximity['railway']['direction']}</p>
-                <p>Name: {proximity['railway']['name']}</p>
-                <hr>
-                <h5><b>🛣️ Highway Proximity:</b></h5>
-                <p>Distance: {proximity['highway']['distance']} km {proximity['highway']['direction']}</p>
-                <p>Name: {proximity['highway']['name']}</p>
-                <hr>
-                <h5><b>🌊 Coastline Proximity:</b></h5>
-                <p>Distance: {proximity['coastline']['distance']} km {proximity['coastline']['direction']}</p>
-                <p>Name: {proximity['coastline']['name']}</p>
-            </div>
-            """
+            popup_content = POPUP_TMPL % {
+                'full_name': stats['full_name'],
+                'locality': stats['locality'],
+                'region': stats['region'],
+                'lat': lat,
+                'lon': lon,
+                'total_launches': stats['total_launches'],
+                'success_rate': stats['success_rate'],
+                'successful_launches': stats['successful_launches'],
+                'railway_distance': proximity['railway']['distance'],
+                'railway_direction': proximity['railway']['direction'],
+                'railway_name': proximity['railway']['name'],
+                'highway_distance': proximity['highway']['distance'],
+                'highway_direction': proximity['highway']['direction'],
+                'highway_name': proximity['highway']['name'],
+                'coastline_distance': proximity['coastline']['distance'],
+                'coastline_direction': proximity['coastline']['direction'],
+                'coastline_name': proximity['coastline']['name'],
+            }
             
             # Determine marker color based on success rate
             if stats['success_rate'] >= 80:
@@ -382,74 +537,73 @@ class SpaceXLaunchMap:
                 color = 'gray'
                 group = inactive_group
             
-            # Create marker with rocket icon - simplified approach
-            try:
-                marker = folium.Marker(
-                    location=[lat, lon],
-                    popup=folium.Popup(popup_content, max_width=400),
-                    tooltip=f"{stats['full_name']} - {stats['success_rate']:.1f}% Success Rate",
-                    icon=folium.Icon(color=color, icon='info-sign')
-                )
-            except:
-                # Fallback to basic marker if icon fails
-                marker = folium.Marker(
-                    location=[lat, lon],
-                    popup=folium.Popup(popup_content, max_width=400),
-                    tooltip=f"{stats['full_name']} - {stats['success_rate']:.1f}% Success Rate"
-                )
-            
+            # Create marker, with a colored icon when the startup probe
+            # confirmed icon support (folium accepts icon=None)
+            marker = folium.Marker(
+                location=[lat, lon],
+                popup=folium.Popup(popup_content, max_width=400),
+                tooltip=f"{stats['full_name']} - {stats['success_rate']:.1f}% Success Rate",
+                icon=folium.Icon(color=color, icon='info-sign') if self._icons_ok else None
+            )
+
             # Add marker to appropriate group
             marker.add_to(group)
+
+            self._marker_features.append({
+                'type': 'Feature',
+                'geometry': {'type': 'Point', 'coordinates': [lon, lat]},
+                'properties': {
+                    'popup': popup_content,
+                    'tooltip': f"{stats['full_name']} - {stats['success_rate']:.1f}% Success Rate",
+                    'color': color
+                }
+            })
             
-            # Add circle showing launch site area
-            folium.Circle(
+            # Mark the launch site area with a constant-screen-size circle
+            # marker instead of a many-vertex geodesic Circle polygon
+            folium.CircleMarker(
                 location=[lat, lon],
-                radius=8000,  # 8km radius
+                radius=12,
                 color=color,
                 fill=True,
-                fillOpacity=0.2,
+                fill_opacity=0.2,
                 weight=2
-            ).add_to(self.map)
-            
-            # Add distance circles for proximity visualization
-            if isinstance(proximity['railway']['distance'], (int, float)):
-                folium.Circle(
-                    location=[lat, lon],
-                    radius=proximity['railway']['distance'] * 1000,  # Convert km to meters
-                    color='blue',
-                    fill=False,
-                    weight=2,
-                    opacity=0.8,
-                    dash_array='10,5'
-                ).add_to(self.map)
-            
-            if isinstance(proximity['highway']['distance'], (int, float)):
-                folium.Circle(
-                    location=[lat, lon],
-                    radius=proximity['highway']['distance'] * 1000,
-                    color='red',
-                    fill=False,
-                    weight=2,
-                    opacity=0.8,
-                    dash_array='10,5'
-                ).add_to(self.map)
-            
-            if isinstance(proximity['coastline']['distance'], (int, float)):
-                folium.Circle(
-                    location=[lat, lon],
-                    radius=proximity['coastline']['distance'] * 1000,
-                    color='cyan',
-                    fill=False,
-                    weight=2,
-                    opacity=0.8,
-                    dash_array='10,5'
-                ).add_to(self.map)
-        
+            ).add_to(circles_group)
+
+            # Collect proximity rings as coarse polygons for the single
+            # GeoJson layer below (km converted to meters)
+            for kind, ring_color in (('railway', 'blue'), ('highway', 'red'), ('coastline', 'cyan')):
+                distance = proximity[kind]['distance']
+                if isinstance(distance, (int, float)):
+                    ring_features.append({
+                        'type': 'Feature',
+                        'geometry': {
+                            'type': 'Polygon',
+                            'coordinates': _circle_polygon(lat, lon, distance * 1000)
+                        },
+                        'properties': {
+                            'style': {
+                                'color': ring_color,
+                                'fill': False,
+                                'weight': 2,
+                                'opacity': 0.8,
+                                'dashArray': '10,5'
+                            }
+                        }
+                    })
+
+        if ring_features:
+            folium.GeoJson(
+                {'type': 'FeatureCollection', 'features': ring_features},
+                style_function=lambda f: f['properties']['style']
+            ).add_to(circles_group)
+
         # Add all feature groups to map
         success_group.add_to(self.map)
         medium_group.add_to(self.map)
         low_group.add_to(self.map)
         inactive_group.add_to(self.map)
+        circles_group.add_to(self.map)
         
         # Add comprehensive legend
         legend_html = '''
@@ -485,8 +639,24 @@ class SpaceXLaunchMap:
         print("✓ Map created successfully!")
         return self.map
     
-    def save_map(self, filename='spacex_launch_map.html'):
-        """Save the map to HTML file"""
+    def save_map(self, filename='spacex_launch_map.html', use_folium=True):
+        """Save the map to HTML file.
+
+        With use_folium=False the markers are dumped as one orjson-encoded
+        GeoJSON FeatureCollection into a static Leaflet skeleton, skipping
+        folium's per-element Jinja2 rendering (much faster, smaller HTML,
+        but without the layer control, legend and plugins)."""
+        if not use_folium and self._marker_features:
+            payload = orjson.dumps({
+                'type': 'FeatureCollection',
+                'features': self._marker_features
+            }).decode()
+            center_lat, center_lon = self._map_center
+            Path(filename).write_text(LEAFLET_TMPL.substitute(
+                CENTER_LAT=center_lat, CENTER_LON=center_lon, DATA=payload
+            ), encoding='utf-8')
+            print(f"✓ Map saved as {filename} (fast Leaflet path)")
+            return True
         if self.map:
             self.map.save(filename)
             print(f"✓ Map saved as {filename}")
@@ -10,16 +10,20 @@ Automatically generates summary reports and visualizations from processed Falcon
 # Step 1: Import Required Libraries
 # ===============================
 from pathlib import Path
+import re
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import logging
 
+# matplotlib/seaborn are imported lazily right before the first plot, so a
+# run that short-circuits on missing data skips their cold import entirely
+
 # ===============================
-# Step 2: Configure logging & plotting style
+# Step 2: Configure logging
 # ===============================
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
-sns.set(style="whitegrid")
 
 # ===============================
 # Step 3: Define project paths
@@ -33,6 +37,12 @@ REPORTS_DIR = PROJECT_ROOT / "outputs" / "reports"
 FIGURES_DIR.mkdir(parents=True, exist_ok=True)
 REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
+
+def write_csv_fast(frame, path):
+    """Write a DataFrame to CSV through Arrow's columnar C++ writer,
+    skipping pandas' per-row formatting path."""
+    pacsv.write_csv(pa.Table.from_pandas(frame, preserve_index=False), str(path))
+
 # ===============================
 # Step 4: Load processed CSV
 # ===============================
@@ -44,7 +54,9 @@ if not processed_file.exists():
     # Instead of sys.exit, we just stop running the rest
     raise FileNotFoundError(f"Processed data file not found: {processed_file}")
 
-df = pd.read_csv(processed_file)
+# Arrow's multithreaded CSV parser is several times faster than the
+# default C engine on this file
+df = pd.read_csv(processed_file, engine='pyarrow')
 logging.info(f"✅ Data loaded from: {processed_file}")
 logging.info(f"📊 Dataset shape: {df.shape}")
 
@@ -57,10 +69,14 @@ for col in essential_cols:
         logging.warning(f"⚠️ Column '{col}' missing. Some plots may be skipped.")
         df[col] = None  # Fill missing columns to avoid crashes
 
-# Convert Date column to datetime and add Year
-if df['Date'].notnull().any():
-    df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
-    df['Year'] = df['Date'].dt.year
+# Convert Date column to datetime and add Year.
+# Sniff the format from the first value so the C fast path is used when the
+# column is ISO-formatted; cache=True dedupes repeated date strings.
+if df['Date'].count():
+    sample = str(df['Date'].dropna().iloc[0])
+    date_format = '%Y-%m-%d' if re.fullmatch(r'\d{4}-\d{2}-\d{2}', sample) else None
+    df['Date'] = pd.to_datetime(df['Date'], format=date_format, errors='coerce', cache=True)
+    df['Year'] = df['Date'].dt.year.astype('Int16')
 else:
     logging.warning("⚠️ 'Date' column is empty or invalid. Skipping year-based plots.")
     df['Year'] = None
@@ -69,23 +85,58 @@ else:
 # Step 6: Save summary statistics
 # ===============================
 summary_file = REPORTS_DIR / "data_summary.csv"
-summary = df.describe(include='all')
+# Numeric describe runs on the fast C path; include='all' would also hash
+# every object column for unique/top/freq, which the report doesn't need.
+# Restricting to number columns also keeps the frame Parquet-friendly
+# (datetime describe rows would mix Timestamps into the output).
+num_df = df.select_dtypes(include=np.number)
+summary = num_df.describe() if not num_df.empty else df.describe(include='all')
 summary.to_csv(summary_file)
+# Parquet cache reads back instantly for downstream consumers
+summary.to_parquet(REPORTS_DIR / "data_summary.parquet")
 logging.info(f"📄 Summary report saved at: {summary_file}")
 
+# Text columns get a cheap count/nunique pass instead of the full describe
+obj_cols = df.select_dtypes(include=["object", "string"])
+if not obj_cols.empty:
+    obj_summary = obj_cols.agg(['count', 'nunique'])
+    obj_summary.to_csv(REPORTS_DIR / "data_summary_categorical.csv")
+    logging.info(f"📄 Categorical summary saved at: {REPORTS_DIR / 'data_summary_categorical.csv'}")
+
+# Import the plotting stack only when at least one plot will be produced;
+# matplotlib + seaborn cost ~0.5 s and a font-cache scan on cold import
+plots_enabled = bool(df['Year'].count() or df['Outcome'].count() or df['Version'].count())
+if plots_enabled:
+    import matplotlib
+    matplotlib.use('Agg')  # Headless raster backend; no GUI event loop to spin up
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    sns.set(style="whitegrid")
+    # Skip the automatic layout solver; savefig(bbox_inches='tight') below
+    # handles trimming once per figure instead
+    plt.rcParams['figure.autolayout'] = False
+
+    # One figure (and its Agg renderer) reused for every plot; ax.clear()
+    # between plots avoids re-allocating the canvas
+    fig, ax = plt.subplots(figsize=(10, 6))
+
 # ===============================
 # Step 7: Plot launches per year
 # ===============================
-if df['Year'].notnull().any():
-    launches_per_year = df.groupby('Year').size().reset_index(name='Launches')
-    plt.figure(figsize=(10, 6))
-    sns.barplot(data=launches_per_year, x='Year', y='Launches', palette='viridis')
-    plt.title("Falcon 9 Launches Per Year")
-    plt.xticks(rotation=45)
-    plt.tight_layout()
+if df['Year'].count():
+    # The data is already counts, so draw the bars directly instead of
+    # routing through seaborn's aggregation/error-bar machinery
+    launches_per_year = df['Year'].dropna().astype(int).value_counts().sort_index()
+    ax.clear()
+    ax.bar(launches_per_year.index.astype(str), launches_per_year.values,
+           color=plt.cm.viridis(np.linspace(0, 1, len(launches_per_year))))
+    ax.set_title("Falcon 9 Launches Per Year")
+    ax.set_ylabel("Launches")
+    ax.tick_params(axis='x', rotation=45)
     launches_per_year_file = FIGURES_DIR / "launches_per_year.png"
-    plt.savefig(launches_per_year_file)
-    plt.close()
+    fig.savefig(launches_per_year_file, bbox_inches='tight', dpi=80, facecolor='white',
+                pil_kwargs={"compress_level": 1})
     logging.info(f"📈 Saved: {launches_per_year_file}")
 else:
     logging.warning("⚠️ Skipping launches per year plot due to missing 'Year' data.")
@@ -93,17 +144,17 @@ else:
 # ===============================
 # Step 8: Plot launch outcomes
 # ===============================
-if df['Outcome'].notnull().any():
+if df['Outcome'].count():
     outcome_counts = df['Outcome'].value_counts()
-    plt.figure(figsize=(8, 6))
-    sns.barplot(x=outcome_counts.index, y=outcome_counts.values, palette='pastel')
-    plt.title("Launch Outcomes")
-    plt.ylabel("Number of Launches")
-    plt.xticks(rotation=45)
-    plt.tight_layout()
+    ax.clear()
+    ax.bar(outcome_counts.index.astype(str), outcome_counts.values,
+           color=plt.cm.Pastel1(np.linspace(0, 1, len(outcome_counts))))
+    ax.set_title("Launch Outcomes")
+    ax.set_ylabel("Number of Launches")
+    ax.tick_params(axis='x', rotation=45)
     outcomes_file = FIGURES_DIR / "launch_outcomes.png"
-    plt.savefig(outcomes_file)
-    plt.close()
+    fig.savefig(outcomes_file, bbox_inches='tight', dpi=80, facecolor='white',
+                pil_kwargs={"compress_level": 1})
     logging.info(f"📊 Saved: {outcomes_file}")
 else:
     logging.warning("⚠️ Skipping launch outcomes plot due to missing 'Outcome' data.")
@@ -111,24 +162,65 @@ else:
 # ===============================
 # Step 9: Plot booster version usage
 # ===============================
-if df['Version'].notnull().any():
-    booster_counts = df['Version'].value_counts()
-    plt.figure(figsize=(10, 6))
-    sns.barplot(x=booster_counts.index, y=booster_counts.values, palette='magma')
-    plt.title("Booster Version Usage Frequency")
-    plt.ylabel("Number of Launches")
-    plt.xticks(rotation=45)
-    plt.tight_layout()
+if df['Version'].count():
+    # One hash-based counting pass feeds both the plot and the CSV report
+    booster_counts = df['Version'].value_counts(dropna=True)
+    ax.clear()
+    ax.bar(booster_counts.index.astype(str), booster_counts.values,
+           color=plt.cm.magma(np.linspace(0, 1, len(booster_counts))))
+    ax.set_title("Booster Version Usage Frequency")
+    ax.set_ylabel("Number of Launches")
+    ax.tick_params(axis='x', rotation=45)
     booster_usage_file = FIGURES_DIR / "booster_usage.png"
-    plt.savefig(booster_usage_file)
-    plt.close()
+    fig.savefig(booster_usage_file, bbox_inches='tight', dpi=80, facecolor='white',
+                pil_kwargs={"compress_level": 1})
     logging.info(f"🚀 Saved: {booster_usage_file}")
 
     booster_report_file = REPORTS_DIR / "booster_report.csv"
-    booster_report = df.groupby('Version').size().reset_index(name='Launch Count')
-    booster_report.to_csv(booster_report_file, index=False)
+    booster_report = booster_counts.rename_axis('Version').reset_index(name='Launch Count')
+    write_csv_fast(booster_report, booster_report_file)
+    # Parquet sibling reloads typed and without text parsing for any
+    # downstream consumer; zstd level 1 keeps the write near-free
+    booster_report.to_parquet(booster_report_file.with_suffix('.parquet'),
+                              engine='pyarrow', compression='zstd',
+                              compression_level=1, index=False)
     logging.info(f"📄 Booster report saved at: {booster_report_file}")
 else:
     logging.warning("⚠️ Skipping booster usage plot due to missing 'Version' data.")
 
+if plots_enabled:
+    plt.close(fig)
+
+# ===============================
+# Step 10: Per-version yearly trend figures
+# ===============================
+VERSION_FIGURES_DIR = FIGURES_DIR / "booster_versions"
+
+
+def plot_one_version(version, sub):
+    """Render one booster version's launches-per-year chart."""
+    counts = sub['Year'].dropna().astype(int).value_counts().sort_index()
+    vfig, vax = plt.subplots(figsize=(8, 5))
+    vax.bar(counts.index.astype(str), counts.values, color='steelblue')
+    vax.set_title(f"{version} Launches Per Year")
+    vax.set_ylabel("Launches")
+    safe_name = re.sub(r'[^A-Za-z0-9._-]+', '_', str(version))
+    vfig.savefig(VERSION_FIGURES_DIR / f"{safe_name}.png", bbox_inches='tight', dpi=80,
+                 facecolor='white', pil_kwargs={"compress_level": 1})
+    plt.close(vfig)
+
+
+if plots_enabled and df['Version'].count() and df['Year'].count():
+    VERSION_FIGURES_DIR.mkdir(parents=True, exist_ok=True)
+    # A handful of small charts doesn't justify a process pool — and this
+    # guard-less script would re-execute wholesale in every worker under
+    # the spawn start method — so render them sequentially
+    saved = 0
+    for version, sub in df.groupby('Version', sort=False):
+        plot_one_version(version, sub)
+        saved += 1
+    logging.info(f"🖼️ Saved {saved} per-version figures to: {VERSION_FIGURES_DIR}")
+else:
+    logging.warning("⚠️ Skipping per-version figures due to missing 'Version' or 'Year' data.")
+
 logging.info("✅ All visuals and reports generated successfully!")
@@ -1,11 +1,20 @@
 # 6_python_run_all.py (Updated)
-# Purpose: Run all Falcon 9 project scripts sequentially with error handling
+# Purpose: Run all Falcon 9 project scripts with error handling,
+# overlapping independent steps to cut total wall time
 # Compatible with latest dashboard (app.run)
 # Author: Muhammad Munawar Shahzad
 # Date: 2025-08-15
 
-import subprocess
+import atexit
+import contextlib
+import io
 import logging
+import os
+import runpy
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # -------------------------------
@@ -27,30 +36,142 @@ steps = {
     "presentation": "scripts/5_presentation.py"
 }
 
+# Step dependencies: a step only starts once all of its dependencies have
+# completed successfully; steps with no ordering constraint run in parallel
+deps = {
+    "data_collection": [],
+    "web_scraping": [],
+    "data_wrangling": ["data_collection", "web_scraping"],
+    "dashboard": ["data_wrangling"],
+    "presentation": ["data_wrangling"]
+}
+
+# One readdir pass replaces a stat() syscall per step when checking that
+# the step scripts actually exist
+present_scripts = {entry.name for entry in os.scandir("scripts") if entry.is_file()}
+
+# Steps the scheduler may run on concurrent threads. runpy's stdout
+# redirect and __main__ swap are process-global and would race across
+# threads, so these run as child processes; steps that run alone use
+# in-process runpy and share the heavy imports.
+parallel_steps = {"data_collection", "web_scraping"}
+
+
 # -------------------------------
-# Run each step
+# Run a single step
 # -------------------------------
-for step_name, script_path in steps.items():
+def run_step(step_name, script_path):
     path = Path(script_path)
-    if not path.exists():
+    if path.name not in present_scripts:
         logging.error(f"❌ Script for step '{step_name}' not found: {path}")
-        continue
+        return False
 
     logging.info(f"🔹 Running step: {step_name} → {path}")
+
+    # The dashboard blocks forever in app.run(), so waiting on it would
+    # stall the whole pipeline: spawn it fire-and-forget, let dependent
+    # steps proceed, and terminate it when the orchestrator exits.
+    # Concurrently scheduled steps get their own processes; the remaining
+    # steps run in this interpreter via runpy so pandas, matplotlib and
+    # friends are imported once instead of once per step.
+    if step_name == "dashboard":
+        try:
+            # sys.executable skips the PATH walk and guarantees the child
+            # runs under the same interpreter/venv as the orchestrator;
+            # -u keeps the child unbuffered so the streaming drain below
+            # sees lines immediately
+            proc = subprocess.Popen(
+                [sys.executable, "-u", str(path)],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                encoding="utf-8",
+                bufsize=1  # line-buffered so output streams as it appears
+            )
+            atexit.register(proc.terminate)
+
+            # Drain the pipe line-by-line on a daemon thread: memory stays
+            # bounded to one line and server output surfaces in real time
+            def drain(p=proc, name=step_name):
+                for line in p.stdout:
+                    logging.info(f"[{name}] {line.rstrip()}")
+
+            threading.Thread(target=drain, daemon=True).start()
+            logging.info(f"🚀 Step '{step_name}' started in the background (pid={proc.pid}).")
+            return True
+
+        except Exception as e:
+            logging.error(f"❌ Unexpected error in step '{step_name}': {e}")
+            return False
+
+    if step_name in parallel_steps:
+        try:
+            proc = subprocess.Popen(
+                [sys.executable, "-u", str(path)],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                encoding="utf-8"  # ensures no UnicodeDecodeError
+            )
+            stdout, stderr = proc.communicate()
+            if proc.returncode:
+                logging.error(f"❌ Step '{step_name}' failed with exit code {proc.returncode}:")
+                logging.error(stderr)
+                return False
+
+            logging.info(stdout)
+            logging.info(f"✅ Step '{step_name}' completed successfully.")
+            return True
+
+        except Exception as e:
+            logging.error(f"❌ Unexpected error in step '{step_name}': {e}")
+            return False
+
+    captured = io.StringIO()
     try:
-        # Run scripts in a separate process
-        result = subprocess.run(
-            ["python", str(path)],
-            check=True,
-            capture_output=True,
-            text=True,
-            encoding="utf-8"  # ensures no UnicodeDecodeError
-        )
-        logging.info(result.stdout)
-        logging.info(f"✅ Step '{step_name}' completed successfully.")
-
-    except subprocess.CalledProcessError as e:
-        logging.error(f"❌ Step '{step_name}' failed with CalledProcessError:")
-        logging.error(e.stderr)
-    except Exception as e:
-        logging.error(f"❌ Unexpected error in step '{step_name}': {e}")
+        with contextlib.redirect_stdout(captured):
+            runpy.run_path(str(path), run_name="__main__")
+    except SystemExit as e:
+        if e.code:
+            logging.error(f"❌ Step '{step_name}' failed with exit code {e.code}:")
+            logging.info(captured.getvalue())
+            return False
+    except Exception:
+        logging.exception(f"❌ Unexpected error in step '{step_name}':")
+        logging.info(captured.getvalue())
+        return False
+    finally:
+        # Drop any figures a plotting step left open before the next one
+        if 'matplotlib.pyplot' in sys.modules:
+            sys.modules['matplotlib.pyplot'].close('all')
+
+    logging.info(captured.getvalue())
+    logging.info(f"✅ Step '{step_name}' completed successfully.")
+    return True
+
+
+# -------------------------------
+# Schedule steps: submit every step whose dependencies are done, wait for
+# one to finish, repeat. The work is subprocess I/O, so threads suffice.
+# -------------------------------
+completed = set()
+pending = dict(steps)
+
+with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+    running = {}
+    while pending or running:
+        ready = [name for name in pending
+                 if all(dep in completed for dep in deps.get(name, []))]
+        for name in ready:
+            running[executor.submit(run_step, name, pending.pop(name))] = name
+
+        if not running:
+            # Everything left is blocked on a failed dependency
+            for name in pending:
+                logging.error(f"⏭️ Skipping step '{name}' because a dependency failed.")
+            break
+
+        future = next(as_completed(running))
+        name = running.pop(future)
+        if future.result():
+            completed.add(name)